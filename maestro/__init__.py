@@ -3,4 +3,4 @@
 # pylama: ignore=W0611
 
 from maestro.steps import PythonStep, step_factory
-from maestro.workflow import Workflow
+from maestro.workflow import TerminationPolicy, Workflow, WorkerPool
@@ -4,19 +4,45 @@ import argparse
 import json
 from typing import Any, Dict
 
-from maestro.workflow import Workflow
+from maestro.workflow import TerminationPolicy, Workflow
 from maestro.workflow.formatter import ExecutionLogFormatter
 
 
+def positive_float(value: str) -> float:
+    """Parse a strictly positive float argument."""
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"{value} is not a number") from exc
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return number
+
+
 def init_parser() -> argparse.ArgumentParser:
     """Initialize parser for the CLI."""
     parser = argparse.ArgumentParser(
-        usage="python -m maestro [WORKFLOW_PATH]",
+        usage=(
+            "python -m maestro [--skip-unrequired-steps] [--fail-fast] "
+            "[--budget SECONDS] [WORKFLOW_PATH]"
+        ),
         description="Command line interface to execute Maestro workflows.",
     )
     parser.add_argument(
         "workflow_path", type=str, action='store', help="path to workflow file"
     )
+    parser.add_argument(
+        "--skip-unrequired-steps", action='store_true',
+        help="skip steps that can't contribute to a reachable output"
+    )
+    parser.add_argument(
+        "--fail-fast", action='store_true',
+        help="stop the whole run as soon as a step fails"
+    )
+    parser.add_argument(
+        "--budget", type=positive_float, action='store', metavar="SECONDS",
+        help="wall-clock budget for the run, in seconds"
+    )
     return parser
 
 
@@ -31,7 +57,14 @@ def command_line_interface() -> None:
     args = init_parser().parse_args()
 
     workflow_spec = get_workflow_json(args.workflow_path)
-    workflow = Workflow.from_dict(workflow_spec)
+    termination_policy = TerminationPolicy(
+        skip_unrequired_steps=args.skip_unrequired_steps,
+        fail_fast=args.fail_fast,
+        budget=args.budget,
+    )
+    workflow = Workflow.from_dict(
+        workflow_spec, termination_policy=termination_policy
+    )
     outputs = workflow.execute()
 
     print(ExecutionLogFormatter(
@@ -15,6 +15,12 @@ LOGGER = logging.getLogger(__name__)
 class PythonStep(Step):
     """Step that executes a Python function."""
 
+    @property
+    def module_path(self) -> str:
+        """Full path of the module where the function is defined."""
+        module_path, _ = self._get_function_module_and_name()
+        return module_path
+
     def _execute(self, inputs_update: Dict[str, Any] = None) -> Any:
         """Execute a Python function based on it's path."""
         inputs = {**self.inputs, **(inputs_update or {})}
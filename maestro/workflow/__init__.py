@@ -2,4 +2,6 @@
 
 # pylama: ignore=W0611
 
+from maestro.workflow.termination import TerminationPolicy
 from maestro.workflow.workflow import Workflow
+from maestro.workflow.worker_pool import WorkerPool
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from maestro.steps import Step
 
@@ -17,6 +17,7 @@ class StepContext:
     step: Step
     depends_on: List[str]
     failed_reason: Optional[str] = None
+    skipped_reason: Optional[str] = None
 
 
 class ExecutionContext:
@@ -28,6 +29,8 @@ class ExecutionContext:
         self.blocked_steps: List[StepContext] = []
         self.successful_steps: List[StepContext] = []
         self.failed_steps: List[StepContext] = []
+        self.skipped_steps: List[StepContext] = []
+        self.output_dependencies: Optional[Dict[str, Set[str]]] = None
         self.current_step: StepContext
 
     @property
@@ -38,10 +41,22 @@ class ExecutionContext:
     def register_step(self, step: Step) -> None:
         """Register a new step in the execution context."""
         LOGGER.debug("Registering step %s.", step.name)
-        step_ctx = StepContext(step=step, depends_on=step.depends_on)
+        step_ctx = StepContext(step=step, depends_on=list(step.depends_on))
         queue = self.blocked_steps if step.depends_on else self.ready_steps
         queue.append(step_ctx)
 
+    def set_output_dependencies(
+        self, dependencies: Dict[str, Set[str]]
+    ) -> None:
+        """Set steps required by each output and skip the unrequired ones."""
+        self.output_dependencies = dependencies
+        self._skip_unrequired_steps("Not required by any requested output")
+
+    def skip_remaining_steps(self, reason: str) -> None:
+        """Skip all steps that are still waiting for execution."""
+        for step_ctx in self.ready_steps + self.blocked_steps:
+            self._skip_step(step_ctx, reason)
+
     def get_next_step(self) -> Step:
         """Get next step ready for execution."""
         self.current_step = self.ready_steps.pop(0)
@@ -56,6 +71,8 @@ class ExecutionContext:
         """Set current running step as failed."""
         self._update_current_step(failed=True, reason=reason)
         self._update_steps_dependent_on_failed_current_step()
+        if self.output_dependencies is not None:
+            self._update_unreachable_outputs()
 
     def _update_current_step(self, failed: bool, reason: str = None) -> None:
         """Update the running step as successful or failed."""
@@ -71,13 +88,44 @@ class ExecutionContext:
         ]
 
     def _update_steps_dependent_on_failed_current_step(self) -> None:
-        """Set steps that depend on failed step as failed."""
-        reason = f"Depended on failed step {self.current_step.step.name}"
-        for step_ctx in self._get_dependent_steps(self.current_step):
-            LOGGER.debug("%s failed: %s", step_ctx.step.name, reason)
-            step_ctx.failed_reason = reason
+        """Set steps that depend on failed step, even indirectly, as failed."""
+        failed_steps = [self.current_step]
+        while failed_steps:
+            failed_step_ctx = failed_steps.pop(0)
+            reason = f"Depended on failed step {failed_step_ctx.step.name}"
+            for step_ctx in self._get_dependent_steps(failed_step_ctx):
+                LOGGER.debug("%s failed: %s", step_ctx.step.name, reason)
+                step_ctx.failed_reason = reason
+                self.blocked_steps.remove(step_ctx)
+                self.failed_steps.append(step_ctx)
+                failed_steps.append(step_ctx)
+
+    def _update_unreachable_outputs(self) -> None:
+        """Discard outputs that need failed steps and skip unrequired steps."""
+        failed_names = {step_ctx.step.name for step_ctx in self.failed_steps}
+        self.output_dependencies = {
+            output: required
+            for output, required in self.output_dependencies.items()
+            if not required & failed_names
+        }
+        self._skip_unrequired_steps("Only required by unreachable outputs")
+
+    def _skip_unrequired_steps(self, reason: str) -> None:
+        """Skip pending steps that aren't required by any output."""
+        required = set().union(*self.output_dependencies.values())
+        for step_ctx in self.ready_steps + self.blocked_steps:
+            if step_ctx.step.name not in required:
+                self._skip_step(step_ctx, reason)
+
+    def _skip_step(self, step_ctx: StepContext, reason: str) -> None:
+        """Remove a pending step from its queue and set it as skipped."""
+        LOGGER.debug("%s skipped: %s", step_ctx.step.name, reason)
+        step_ctx.skipped_reason = reason
+        if step_ctx in self.ready_steps:
+            self.ready_steps.remove(step_ctx)
+        else:
             self.blocked_steps.remove(step_ctx)
-            self.failed_steps.append(step_ctx)
+        self.skipped_steps.append(step_ctx)
 
     def _update_steps_dependent_on_successful_current_step(self) -> None:
         """Update dependencies and queue newly indepedent steps."""
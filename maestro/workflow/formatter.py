@@ -48,6 +48,9 @@ class ExecutionLogFormatter:
             f"{s.step.name}: SUCCESSFUL" if not s.failed_reason else
             f"{s.step.name}: FAILED\n      |_ Reason: {s.failed_reason}"
             for s in step_list
+        ] + [
+            f"{s.step.name}: SKIPPED\n      |_ Reason: {s.skipped_reason}"
+            for s in self._context.skipped_steps
         ]
         return self._format_as_list("Steps", elements)
 
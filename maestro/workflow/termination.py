@@ -0,0 +1,61 @@
+"""Module with the termination policy abstraction."""
+
+from dataclasses import dataclass
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from maestro.steps import Step
+from maestro.workflow.variable_pool import VariablePool
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class TerminationPolicy:
+    """Data class with the rules to terminate a workflow execution early.
+
+    With ``skip_unrequired_steps``, steps that can't contribute to a
+    reachable requested output are skipped. With ``fail_fast``, the whole run
+    stops at the first failed step, and ``budget`` bounds the run's
+    wall-clock time in seconds. The default policy never stops a run early.
+    """
+
+    skip_unrequired_steps: bool = False
+    fail_fast: bool = False
+    budget: Optional[float] = None
+
+
+def get_output_dependencies(
+    steps: List[Step], outputs: Dict[str, Any]
+) -> Dict[str, Set[str]]:
+    """Map each output to the names of the steps required to compute it."""
+    steps_by_name = {step.name: step for step in steps}
+    return {
+        name: _get_step_and_ancestors(
+            VariablePool.get_referenced_entity(value, steps_by_name),
+            steps_by_name,
+        )
+        for name, value in outputs.items()
+    }
+
+
+def _get_step_and_ancestors(
+    step_name: Optional[str], steps_by_name: Dict[str, Step]
+) -> Set[str]:
+    """Get a step and all the steps it depends on, directly or not."""
+    required: Set[str] = set()
+    pending = [step_name]
+    while pending:
+        name = pending.pop()
+        if name in required or name not in steps_by_name:
+            continue
+        required.add(name)
+        step = steps_by_name[name]
+        pending.extend(step.depends_on)
+        pending.extend(
+            VariablePool.get_referenced_entity(value, steps_by_name)
+            for value in step.inputs.values()
+        )
+    LOGGER.debug("Steps required by %s: %s", step_name, required)
+    return required
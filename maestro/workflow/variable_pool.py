@@ -1,10 +1,11 @@
 """Module with the variable pool abstraction."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 
 
 LOGGER = logging.getLogger(__name__)
+INTERFACES = ("inputs", "outputs")
 
 
 class VariablePool:
@@ -29,6 +30,21 @@ class VariablePool:
             for name, value in variables.items()
         }
 
+    @staticmethod
+    def get_referenced_entity(
+        value: Any, entities: Iterable[str]
+    ) -> Optional[str]:
+        """Get which of the given entities a reference variable points to."""
+        if not isinstance(value, str) or not value.endswith(" }}"):
+            return None
+        for entity in entities:
+            if any(
+                value.startswith(f"{{{{ {entity}.{interface}.")
+                for interface in INTERFACES
+            ):
+                return entity
+        return None
+
     def _set_values(
         self, entity: str, interface: str, values: Dict[str, Any]
     ) -> None:
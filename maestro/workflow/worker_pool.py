@@ -0,0 +1,216 @@
+"""Module with the persistent worker pool abstraction."""
+
+from __future__ import annotations
+import atexit
+from dataclasses import dataclass, field
+import logging
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+import os
+from pickle import PicklingError
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from maestro.exceptions import FailedStepException
+from maestro.steps import PythonStep, Step
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _get_max_rss() -> int:
+    """Get the peak resident set size of the current process, in kilobytes."""
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports the value in bytes, while Linux reports it in kilobytes
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def _worker_loop(connection: Connection) -> None:
+    """Execute steps received through the connection until told to stop."""
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+
+        step, inputs_update = task
+        try:
+            outputs, reason = step.execute(inputs_update), None
+        except FailedStepException as exc:
+            outputs, reason = None, str(exc)
+
+        try:
+            connection.send((outputs, reason, _get_max_rss()))
+        except Exception as exc:  # pylint: disable=broad-except
+            reason = f"Outputs could not be sent back: {exc}"
+            connection.send((None, reason, _get_max_rss()))
+
+    connection.close()
+
+
+@dataclass
+class Worker:
+    """Data class for a long-lived process in the worker pool."""
+
+    process: Process
+    connection: Connection
+    modules: Set[str] = field(default_factory=set)
+    tasks_done: int = 0
+    max_rss: int = 0
+
+
+class WorkerPool:
+    """Pool of long-lived processes that keep step modules imported.
+
+    Steps are routed to a worker that already imported the step's module,
+    so consecutive executions (even across workflows) don't pay the import
+    cost again. Workers are recycled after ``max_tasks_per_worker`` tasks or
+    once their peak resident memory exceeds ``max_rss_per_worker`` kilobytes
+    (only on POSIX systems, where the ``resource`` module is available).
+
+    Workers aren't daemonic, so steps may start their own subprocesses. The
+    pool must be closed (or used as a context manager) to stop them; as a
+    fallback, open pools are closed when the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        size: int = None,
+        max_tasks_per_worker: int = None,
+        max_rss_per_worker: int = None,
+    ) -> None:
+        """Initialize pool attributes; workers are started on demand."""
+        self.size = size or os.cpu_count() or 1
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_rss_per_worker = max_rss_per_worker
+        if max_rss_per_worker and resource is None:
+            LOGGER.warning(
+                "Memory usage can't be measured on this platform; "
+                "max_rss_per_worker will be ignored."
+            )
+        self.workers: List[Worker] = []
+        self._exit_hook_registered = False
+
+    def __enter__(self) -> WorkerPool:
+        """Return the pool itself when used as a context manager."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Shut down all workers when leaving the context."""
+        self.close()
+
+    def execute(
+        self,
+        step: Step,
+        inputs_update: Dict[str, Any] = None,
+        timeout: float = None,
+    ) -> Dict[str, Any]:
+        """Execute a step in a worker and return its outputs.
+
+        If the step doesn't finish within ``timeout`` seconds, its worker is
+        terminated and the step fails.
+        """
+        module_path = self._get_module_path(step)
+        worker = self._get_worker(module_path)
+        LOGGER.debug(
+            "Sending step %s to worker %s.", step.name, worker.process.pid
+        )
+
+        try:
+            worker.connection.send((step, inputs_update))
+        except (PicklingError, TypeError, AttributeError) as exc:
+            raise FailedStepException(
+                f"Inputs could not be sent to worker: {exc}"
+            ) from exc
+        except OSError as exc:
+            self._stop_worker(worker)
+            raise FailedStepException(f"Worker died: {exc}") from exc
+
+        try:
+            if not worker.connection.poll(timeout):
+                self._stop_worker(worker, terminate=True)
+                raise FailedStepException(f"Timed out after {timeout:.2f}s")
+            outputs, reason, worker.max_rss = worker.connection.recv()
+        except (EOFError, OSError) as exc:
+            self._stop_worker(worker)
+            raise FailedStepException(f"Worker died: {exc}") from exc
+
+        if reason is None:
+            worker.modules.add(module_path)
+        worker.tasks_done += 1
+        if self._should_recycle(worker):
+            LOGGER.debug("Recycling worker %s.", worker.process.pid)
+            self._stop_worker(worker)
+
+        if reason is not None:
+            raise FailedStepException(reason)
+        return outputs
+
+    def close(self) -> None:
+        """Shut down all workers in the pool."""
+        for worker in list(self.workers):
+            self._stop_worker(worker)
+        if self._exit_hook_registered:
+            atexit.unregister(self.close)
+            self._exit_hook_registered = False
+
+    def _get_worker(self, module_path: str) -> Worker:
+        """Get a worker, preferring one that already imported the module."""
+        for worker in self.workers:
+            if module_path in worker.modules:
+                return worker
+
+        if len(self.workers) < self.size:
+            return self._start_worker()
+        return min(self.workers, key=lambda worker: len(worker.modules))
+
+    def _start_worker(self) -> Worker:
+        """Start a new worker process and add it to the pool."""
+        parent_connection, child_connection = Pipe()
+        process = Process(target=_worker_loop, args=(child_connection,))
+        process.start()
+        child_connection.close()
+
+        worker = Worker(process=process, connection=parent_connection)
+        self.workers.append(worker)
+        if not self._exit_hook_registered:
+            atexit.register(self.close)
+            self._exit_hook_registered = True
+        LOGGER.debug("Started worker %s.", process.pid)
+        return worker
+
+    def _stop_worker(self, worker: Worker, terminate: bool = False) -> None:
+        """Stop a worker process and remove it from the pool."""
+        self.workers.remove(worker)
+        if terminate:
+            worker.process.terminate()
+        try:
+            worker.connection.send(None)
+        except OSError:
+            pass
+        worker.connection.close()
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+
+    def _should_recycle(self, worker: Worker) -> bool:
+        """Check if a worker has exceeded its task count or memory limit."""
+        limits: List[Tuple[Optional[int], int]] = [
+            (self.max_tasks_per_worker, worker.tasks_done),
+            (self.max_rss_per_worker, worker.max_rss),
+        ]
+        return any(limit and value >= limit for limit, value in limits)
+
+    @staticmethod
+    def _get_module_path(step: Step) -> str:
+        """Get the affinity key used to route a step to a worker."""
+        if isinstance(step, PythonStep):
+            return step.module_path
+        return step.path
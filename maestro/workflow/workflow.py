@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 import logging
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 
 from maestro.steps import Step, step_factory
 from maestro.exceptions import FailedStepException
 from maestro.workflow.execution_context import ExecutionContext
+from maestro.workflow.termination import (
+    TerminationPolicy, get_output_dependencies
+)
 from maestro.workflow.variable_pool import VariablePool
+from maestro.workflow.worker_pool import WorkerPool
 
 
 LOGGER = logging.getLogger(__name__)
@@ -22,37 +27,78 @@ class Workflow:
         steps: List[Step] = None,
         inputs: Dict[str, Any] = None,
         outputs: Dict[str, Any] = None,
+        worker_pool: WorkerPool = None,
+        termination_policy: TerminationPolicy = None,
     ) -> None:
         """Initialize workflow attributes."""
         self.name = name
         self.steps = steps or []
         self.inputs = inputs or {}
         self.outputs = outputs or {}
+        self.worker_pool = worker_pool
+        self.termination_policy = termination_policy or TerminationPolicy()
         self.last_context = ExecutionContext()
         self.last_variable_pool = VariablePool()
 
-    def execute(self) -> Dict[str, Any]:
-        """Execute the workflow and return its outputs."""
+    def execute(self, outputs: List[str] = None) -> Dict[str, Any]:
+        """Execute the workflow and return its (requested) outputs."""
         LOGGER.info("Executing workflow %s.", self.name)
-        self._initialize_context_and_pool()
+        requested_outputs = self._get_requested_outputs(outputs)
+        self._initialize_context_and_pool(requested_outputs)
+        policy = self.termination_policy
+        deadline = None if policy.budget is None else (
+            time.monotonic() + policy.budget
+        )
 
         while not self.last_context.finished:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                reason = f"Run exceeded its budget of {policy.budget}s"
+                LOGGER.warning("Stopping workflow %s: %s", self.name, reason)
+                self.last_context.skip_remaining_steps(reason)
+                break
+
             current_step = self.last_context.get_next_step()
             inputs = self.last_variable_pool.get_values(current_step.inputs)
             try:
                 LOGGER.debug("Executing step %s.", current_step.name)
-                outputs = current_step.execute(inputs)
+                outputs = self._execute_step(current_step, inputs, timeout)
                 self.last_context.set_current_step_as_successful()
                 self.last_variable_pool.set_outputs(current_step.name, outputs)
             except FailedStepException as exc:
                 LOGGER.warning("%s failed: %s", current_step.name, str(exc))
                 self.last_context.set_current_step_as_failed(str(exc))
+                if policy.fail_fast:
+                    self.last_context.skip_remaining_steps(
+                        f"Run stopped after step {current_step.name} failed"
+                    )
 
-        outputs = self.last_variable_pool.get_values(self.outputs)
+        outputs = self.last_variable_pool.get_values(requested_outputs)
         LOGGER.debug("Workflow execution outputs: %s", outputs)
         return outputs
 
-    def _initialize_context_and_pool(self) -> None:
+    def _get_requested_outputs(
+        self, names: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Get the outputs specification filtered by the requested names."""
+        if names is None:
+            return self.outputs
+        unknown_names = set(names) - set(self.outputs)
+        if unknown_names:
+            raise ValueError(f"Outputs {unknown_names} do not exist.")
+        return {name: self.outputs[name] for name in names}
+
+    def _execute_step(
+        self, step: Step, inputs: Dict[str, Any], timeout: float = None
+    ) -> Dict[str, Any]:
+        """Execute a step locally or in the worker pool, if there is one."""
+        if self.worker_pool is None:
+            return step.execute(inputs)
+        return self.worker_pool.execute(step, inputs, timeout)
+
+    def _initialize_context_and_pool(
+        self, requested_outputs: Dict[str, Any]
+    ) -> None:
         """Initialize a new context and variable pool for the execution."""
         self.last_context = ExecutionContext()
         self.last_variable_pool = VariablePool()
@@ -63,10 +109,25 @@ class Workflow:
             self.last_variable_pool.set_inputs(step.name, step.inputs)
             self.last_context.register_step(step)
 
+        if self.termination_policy.skip_unrequired_steps and self.outputs:
+            self.last_context.set_output_dependencies(
+                get_output_dependencies(self.steps, requested_outputs)
+            )
+
     @classmethod
-    def from_dict(cls, spec: Dict[str, Any]) -> Workflow:
+    def from_dict(
+        cls,
+        spec: Dict[str, Any],
+        worker_pool: WorkerPool = None,
+        termination_policy: TerminationPolicy = None,
+    ) -> Workflow:
         """Build workflow from a dictionary specification."""
         workflow_spec = spec.copy()
         steps_spec = workflow_spec.pop("steps", [])
         steps = [step_factory.create(step_spec) for step_spec in steps_spec]
-        return cls(**workflow_spec, steps=steps)
+        return cls(
+            **workflow_spec,
+            steps=steps,
+            worker_pool=worker_pool,
+            termination_policy=termination_policy,
+        )
@@ -0,0 +1,51 @@
+"""Unit tests for the command line interface."""
+
+import contextlib
+import io
+import unittest
+
+from maestro.__main__ import init_parser
+
+
+class TestInitParser(unittest.TestCase):
+    """Suite of unit tests for the CLI parser."""
+
+    def setUp(self) -> None:
+        """Set up the CLI parser."""
+        self.parser = init_parser()
+
+    def test_termination_flags(self) -> None:
+        """Test if the termination policy flags are parsed."""
+        # Act
+        args = self.parser.parse_args([
+            "--skip-unrequired-steps", "--fail-fast", "--budget", "1.5",
+            "workflow.json",
+        ])
+
+        # Assert
+        self.assertTrue(args.skip_unrequired_steps)
+        self.assertTrue(args.fail_fast)
+        self.assertEqual(1.5, args.budget)
+
+    def test_termination_flags_defaults(self) -> None:
+        """Test if no termination flags means the default policy."""
+        # Act
+        args = self.parser.parse_args(["workflow.json"])
+
+        # Assert
+        self.assertFalse(args.skip_unrequired_steps)
+        self.assertFalse(args.fail_fast)
+        self.assertIsNone(args.budget)
+
+    def test_rejects_non_positive_budget(self) -> None:
+        """Test if the parser exits when the budget isn't positive."""
+        for budget in ["0", "-1", "abc"]:
+            with self.subTest(budget=budget):
+                # Act, assert
+                with contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit):
+                        self.parser.parse_args(["--budget", budget, "wf.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
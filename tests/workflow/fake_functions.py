@@ -0,0 +1,14 @@
+"""Module with functions used by workflow tests that need real processes."""
+
+from multiprocessing import Pool
+
+
+def square(value: float) -> float:
+    """Square a value."""
+    return value * value
+
+
+def square_in_child_process(value: float) -> float:
+    """Square a value inside a child process."""
+    with Pool(1) as pool:
+        return pool.apply(square, (value,))
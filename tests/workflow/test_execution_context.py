@@ -0,0 +1,82 @@
+"""Unit tests for the execution context class."""
+
+import unittest
+from typing import List
+
+from maestro.workflow.execution_context import ExecutionContext, StepContext
+from tests.steps.fake_step import FakeStep
+
+
+class TestExecutionContextClass(unittest.TestCase):
+    """Suite of unit tests for the ExecutionContext class."""
+
+    def setUp(self) -> None:
+        """Set up an ExecutionContext with a chain and an independent step."""
+        self.context = ExecutionContext()
+        self.context.register_step(FakeStep("first", "test_path"))
+        self.context.register_step(
+            FakeStep("second", "test_path", depends_on=["first"])
+        )
+        self.context.register_step(
+            FakeStep("third", "test_path", depends_on=["second"])
+        )
+        self.context.register_step(FakeStep("independent", "test_path"))
+
+    @staticmethod
+    def _get_names(step_list: List[StepContext]) -> List[str]:
+        """Get the step names of a list of step contexts."""
+        return [step_ctx.step.name for step_ctx in step_list]
+
+    def test_fail_transitive_dependents(self) -> None:
+        """Test if steps depending indirectly on a failed step fail."""
+        # Act
+        self.context.get_next_step()
+        self.context.set_current_step_as_failed("error")
+
+        # Assert
+        self.assertEqual(
+            ["first", "second", "third"],
+            self._get_names(self.context.failed_steps)
+        )
+        self.assertEqual([], self.context.blocked_steps)
+
+    def test_skip_steps_not_required_by_outputs(self) -> None:
+        """Test if steps not required by any output are skipped."""
+        # Act
+        self.context.set_output_dependencies({"x": {"first"}})
+
+        # Assert
+        self.assertCountEqual(
+            ["second", "third", "independent"],
+            self._get_names(self.context.skipped_steps)
+        )
+
+    def test_skip_steps_only_required_by_unreachable_outputs(self) -> None:
+        """Test if steps of outputs that can't be computed are skipped."""
+        # Arrange
+        self.context.set_output_dependencies({
+            "x": {"first", "second", "third", "independent"}
+        })
+
+        # Act
+        self.context.get_next_step()
+        self.context.set_current_step_as_failed("error")
+
+        # Assert
+        self.assertEqual(
+            ["independent"], self._get_names(self.context.skipped_steps)
+        )
+        self.assertFalse(self.context.output_dependencies)
+
+    def test_skip_remaining_steps(self) -> None:
+        """Test if all pending steps are skipped."""
+        # Act
+        self.context.skip_remaining_steps("stopped")
+
+        # Assert
+        self.assertTrue(self.context.finished)
+        self.assertEqual(4, len(self.context.skipped_steps))
+
+
+if __name__ == '__main__':
+    unittest.main()
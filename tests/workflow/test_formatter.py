@@ -0,0 +1,52 @@
+"""Unit tests for the execution log formatter class."""
+
+import unittest
+
+from maestro.workflow.execution_context import ExecutionContext
+from maestro.workflow.formatter import ExecutionLogFormatter
+from tests.steps.fake_step import FakeStep
+
+
+class TestExecutionLogFormatterClass(unittest.TestCase):
+    """Suite of unit tests for the ExecutionLogFormatter class."""
+
+    def setUp(self) -> None:
+        """Set up a context with a successful, a failed and a skipped step."""
+        self.context = ExecutionContext()
+        for name in ["successful", "failed", "skipped"]:
+            self.context.register_step(FakeStep(name, "test_path"))
+
+        self.context.get_next_step()
+        self.context.set_current_step_as_successful()
+        self.context.get_next_step()
+        self.context.set_current_step_as_failed("error")
+        self.context.skip_remaining_steps("Run stopped")
+
+        self.formatter = ExecutionLogFormatter(
+            workflow_name="test_workflow",
+            workflow_inputs={"x": 1},
+            execution_context=self.context,
+            execution_outputs={"y": 2},
+        )
+
+    def test_format_steps(self) -> None:
+        """Test if every step is listed with its status and reason."""
+        # Arrange
+        steps_expected = "\n".join([
+            "Steps:",
+            "    - successful: SUCCESSFUL",
+            "    - failed: FAILED",
+            "      |_ Reason: error",
+            "    - skipped: SKIPPED",
+            "      |_ Reason: Run stopped",
+        ])
+
+        # Act
+        log = self.formatter.format()
+
+        # Assert
+        self.assertIn(steps_expected, log)
+
+
+if __name__ == '__main__':
+    unittest.main()
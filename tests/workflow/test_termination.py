@@ -0,0 +1,61 @@
+"""Unit tests for the termination policy functions."""
+
+import unittest
+
+from maestro.workflow.termination import get_output_dependencies
+from tests.steps.fake_step import FakeStep
+
+
+class TestGetOutputDependencies(unittest.TestCase):
+    """Suite of unit tests for the get_output_dependencies function."""
+
+    def setUp(self) -> None:
+        """Set up a chain of steps and an independent step."""
+        self.steps = [
+            FakeStep("first", "test_path"),
+            FakeStep(
+                "second", "test_path",
+                inputs={"x": "{{ first.outputs.x }}"}
+            ),
+            FakeStep("third", "test_path", depends_on=["second"]),
+            FakeStep("independent", "test_path"),
+        ]
+
+    def test_includes_indirect_dependencies(self) -> None:
+        """Test if steps required by other steps are included."""
+        # Arrange
+        outputs = {"z": "{{ third.outputs.z }}"}
+        dependencies_expected = {"z": {"first", "second", "third"}}
+
+        # Act
+        dependencies = get_output_dependencies(self.steps, outputs)
+
+        # Assert
+        self.assertEqual(dependencies_expected, dependencies)
+
+    def test_literal_output_requires_no_steps(self) -> None:
+        """Test if an output that isn't a reference requires no steps."""
+        # Act
+        dependencies = get_output_dependencies(self.steps, {"y": 1})
+
+        # Assert
+        self.assertEqual({"y": set()}, dependencies)
+
+    def test_resolves_dotted_step_names(self) -> None:
+        """Test if outputs of steps with dots in their names are resolved."""
+        # Arrange
+        self.steps.append(FakeStep(
+            "dotted.step", "test_path",
+            inputs={"x": "{{ first.outputs.x }}"}
+        ))
+        outputs = {"o": "{{ dotted.step.outputs.o }}"}
+
+        # Act
+        dependencies = get_output_dependencies(self.steps, outputs)
+
+        # Assert
+        self.assertEqual({"o": {"first", "dotted.step"}}, dependencies)
+
+
+if __name__ == '__main__':
+    unittest.main()
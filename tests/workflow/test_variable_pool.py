@@ -64,6 +64,36 @@ class TestVariablePoolClass(unittest.TestCase):
         # Assert
         self.assertEqual(inputs_expected, inputs)
 
+    def test_get_referenced_entity(self) -> None:
+        """Test if the entity of a reference variable is found."""
+        # Act
+        entity = VariablePool.get_referenced_entity(
+            "{{ test.outputs.y }}", ["other", "test"]
+        )
+
+        # Assert
+        self.assertEqual("test", entity)
+
+    def test_get_referenced_entity_with_dotted_name(self) -> None:
+        """Test if entities with dots in their names are found."""
+        # Act
+        entity = VariablePool.get_referenced_entity(
+            "{{ test.step.outputs.y }}", ["test", "test.step"]
+        )
+
+        # Assert
+        self.assertEqual("test.step", entity)
+
+    def test_get_referenced_entity_of_literal_value(self) -> None:
+        """Test if values that aren't references have no entity."""
+        # Act, assert
+        self.assertIsNone(VariablePool.get_referenced_entity("test", ["test"]))
+        self.assertIsNone(VariablePool.get_referenced_entity(1, ["test"]))
+        self.assertIsNone(
+            VariablePool.get_referenced_entity(
+                "{{ unknown.outputs.y }}", ["test"]
+            )
+        )
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,154 @@
+"""Unit tests for the worker pool class."""
+
+import threading
+import unittest
+from unittest import mock
+
+from maestro.exceptions import FailedStepException
+from maestro.steps import PythonStep
+from maestro.workflow import Workflow
+from maestro.workflow.worker_pool import WorkerPool
+
+
+class TestWorkerPoolClass(unittest.TestCase):
+    """Suite of unit tests for the WorkerPool class."""
+
+    def setUp(self) -> None:
+        """Set up a WorkerPool and a PythonStep."""
+        self.worker_pool = WorkerPool(size=2)
+        self.step = PythonStep("floor_float", "math.floor", outputs=["value"])
+
+    def tearDown(self) -> None:
+        """Shut down the pool's workers."""
+        self.worker_pool.close()
+
+    def test_execute(self) -> None:
+        """Test if the pool correctly executes the step in a worker."""
+        # Arrange
+        outputs_expected = {"value": 3}
+
+        # Act
+        outputs = self.worker_pool.execute(self.step, {"x": 3.14})
+
+        # Assert
+        self.assertEqual(outputs_expected, outputs)
+
+    def test_raises_failed_step_when_exception_occurs(self) -> None:
+        """Test if FailedStepException is raised when the step fails."""
+        # Act, assert
+        with self.assertRaises(FailedStepException):
+            self.worker_pool.execute(self.step, {"x": "not a number"})
+
+    def test_routes_step_to_worker_with_module_loaded(self) -> None:
+        """Test if steps of the same module are sent to the same worker."""
+        # Arrange
+        other_step = PythonStep("sqrt", "math.sqrt", outputs=["value"])
+
+        # Act
+        self.worker_pool.execute(self.step, {"x": 3.14})
+        self.worker_pool.execute(other_step, {"x": 4})
+
+        # Assert
+        self.assertEqual(1, len(self.worker_pool.workers))
+        self.assertEqual(2, self.worker_pool.workers[0].tasks_done)
+
+    def test_recycles_worker_after_max_tasks(self) -> None:
+        """Test if a worker is recycled after reaching its task limit."""
+        # Arrange
+        self.worker_pool.max_tasks_per_worker = 2
+        self.worker_pool.execute(self.step, {"x": 3.14})
+        process = self.worker_pool.workers[0].process
+
+        # Act
+        self.worker_pool.execute(self.step, {"x": 3.14})
+
+        # Assert
+        self.assertEqual([], self.worker_pool.workers)
+        self.assertFalse(process.is_alive())
+
+    def test_recycles_worker_after_max_rss(self) -> None:
+        """Test if a worker is recycled after exceeding its memory limit."""
+        # Arrange
+        self.worker_pool.max_rss_per_worker = 1
+
+        # Act
+        self.worker_pool.execute(self.step, {"x": 3.14})
+
+        # Assert
+        self.assertEqual([], self.worker_pool.workers)
+
+    def test_warns_when_rss_cannot_be_measured(self) -> None:
+        """Test if a warning is logged when max_rss_per_worker is ignored."""
+        # Act, assert
+        with mock.patch("maestro.workflow.worker_pool.resource", None):
+            with self.assertLogs("maestro.workflow.worker_pool", "WARNING"):
+                WorkerPool(max_rss_per_worker=1)
+
+    def test_does_not_route_to_worker_that_failed_import(self) -> None:
+        """Test if a failed step doesn't mark its module as loaded."""
+        # Arrange
+        step = PythonStep("missing", "inexistent_module.function")
+
+        # Act
+        with self.assertRaises(FailedStepException):
+            self.worker_pool.execute(step)
+
+        # Assert
+        self.assertEqual(set(), self.worker_pool.workers[0].modules)
+
+    def test_raises_failed_step_when_inputs_are_not_picklable(self) -> None:
+        """Test if FailedStepException is raised for unpicklable inputs."""
+        # Act, assert
+        with self.assertRaises(FailedStepException):
+            self.worker_pool.execute(self.step, {"x": threading.Lock()})
+        with self.assertRaises(FailedStepException):
+            self.worker_pool.execute(self.step, {"x": lambda: 3.14})
+
+    def test_step_can_start_child_processes(self) -> None:
+        """Test if steps running in workers can start their own processes."""
+        # Arrange
+        step = PythonStep(
+            "square", "tests.workflow.fake_functions.square_in_child_process",
+            outputs=["value"]
+        )
+
+        # Act
+        outputs = self.worker_pool.execute(step, {"x": 3})
+
+        # Assert
+        self.assertEqual({"value": 9}, outputs)
+
+    def test_keeps_worker_across_workflow_executions(self) -> None:
+        """Test if consecutive workflow executions reuse the same worker."""
+        # Arrange
+        self.step.inputs = {"x": 3.14}
+        workflow = Workflow(
+            "test_workflow", steps=[self.step], worker_pool=self.worker_pool
+        )
+
+        # Act
+        workflow.execute()
+        pid = self.worker_pool.workers[0].process.pid
+        workflow.execute()
+
+        # Assert
+        self.assertEqual(1, len(self.worker_pool.workers))
+        self.assertEqual(pid, self.worker_pool.workers[0].process.pid)
+        self.assertEqual(2, self.worker_pool.workers[0].tasks_done)
+        self.assertEqual({"math"}, self.worker_pool.workers[0].modules)
+
+    def test_raises_failed_step_when_timeout_expires(self) -> None:
+        """Test if a step running past its timeout kills its worker."""
+        # Arrange
+        step = PythonStep("sleep", "time.sleep")
+
+        # Act
+        with self.assertRaises(FailedStepException):
+            self.worker_pool.execute(step, {"seconds": 5}, timeout=0.2)
+
+        # Assert
+        self.assertEqual([], self.worker_pool.workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
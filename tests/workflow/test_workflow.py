@@ -0,0 +1,119 @@
+"""Unit tests for the workflow class."""
+
+from typing import Dict, List
+import unittest
+
+from maestro.steps import PythonStep
+from maestro.workflow import TerminationPolicy, Workflow, WorkerPool
+
+
+class TestWorkflowClass(unittest.TestCase):
+    """Suite of unit tests for the Workflow class."""
+
+    def setUp(self) -> None:
+        """Set up a workflow with a failing and an independent step."""
+        self.workflow = Workflow(
+            "test_workflow",
+            steps=[
+                PythonStep(
+                    "failing", "math.floor",
+                    inputs={"x": "not a number"}, outputs=["value"]
+                ),
+                PythonStep(
+                    "independent", "math.floor",
+                    inputs={"x": 3.14}, outputs=["value"]
+                ),
+            ],
+            outputs={
+                "failing": "{{ failing.outputs.value }}",
+                "independent": "{{ independent.outputs.value }}",
+            },
+        )
+
+    @staticmethod
+    def _get_status(workflow: Workflow) -> Dict[str, List[str]]:
+        """Get the names of the steps in each final state of the execution."""
+        context = workflow.last_context
+        return {
+            "successful": [s.step.name for s in context.successful_steps],
+            "failed": [s.step.name for s in context.failed_steps],
+            "skipped": [s.step.name for s in context.skipped_steps],
+        }
+
+    def test_execute_without_policy_runs_every_step(self) -> None:
+        """Test if all steps run when no termination policy is set."""
+        # Act
+        outputs = self.workflow.execute(outputs=["failing"])
+
+        # Assert
+        self.assertEqual(["failing"], list(outputs))
+        self.assertEqual(
+            {"successful": ["independent"], "failed": ["failing"],
+             "skipped": []},
+            self._get_status(self.workflow)
+        )
+
+    def test_execute_with_requested_outputs(self) -> None:
+        """Test if steps not required by requested outputs are skipped."""
+        # Arrange
+        self.workflow.termination_policy = TerminationPolicy(
+            skip_unrequired_steps=True
+        )
+
+        # Act
+        outputs = self.workflow.execute(outputs=["independent"])
+
+        # Assert
+        self.assertEqual({"independent": 3}, outputs)
+        self.assertEqual(
+            {"successful": ["independent"], "failed": [],
+             "skipped": ["failing"]},
+            self._get_status(self.workflow)
+        )
+
+    def test_raises_value_error_when_inexistent_output(self) -> None:
+        """Test if ValueError is raised when an output doesn't exist."""
+        # Act, assert
+        with self.assertRaises(ValueError):
+            self.workflow.execute(outputs=["inexistent_output"])
+
+    def test_fail_fast_skips_remaining_steps(self) -> None:
+        """Test if the remaining steps are skipped after a failure."""
+        # Arrange
+        self.workflow.termination_policy = TerminationPolicy(fail_fast=True)
+
+        # Act
+        self.workflow.execute()
+
+        # Assert
+        self.assertEqual(
+            {"successful": [], "failed": ["failing"],
+             "skipped": ["independent"]},
+            self._get_status(self.workflow)
+        )
+
+    def test_budget_cancels_running_step_and_skips_remaining(self) -> None:
+        """Test if a step running past the budget is cancelled."""
+        # Arrange
+        self.workflow.steps[0] = PythonStep(
+            "failing", "time.sleep", inputs={"seconds": 5}
+        )
+        self.workflow.termination_policy = TerminationPolicy(budget=0.2)
+
+        # Act
+        with WorkerPool(size=1) as worker_pool:
+            self.workflow.worker_pool = worker_pool
+            self.workflow.execute()
+
+        # Assert
+        self.assertEqual(
+            {"successful": [], "failed": ["failing"],
+             "skipped": ["independent"]},
+            self._get_status(self.workflow)
+        )
+        failed_step_ctx = self.workflow.last_context.failed_steps[0]
+        self.assertIn("Timed out", failed_step_ctx.failed_reason)
+
+
+if __name__ == '__main__':
+    unittest.main()